@@ -1,5 +1,16 @@
+import copy
+import os
+from collections import OrderedDict
+
 import yaml
 
+# libyaml(C 확장)이 설치된 환경에서는 C 파서를 사용하고, 없으면 순수 파이썬 SafeLoader로 대체
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# 파싱 결과 캐시: {abspath: (mtime, size, parsed)}
+_CACHE_MAX = 100
+_cache: "OrderedDict[str, tuple[float, int, dict]]" = OrderedDict()
+
 def load_config(path: str) -> dict:
     """
     YAML 형식의 설정 파일(config.yaml)을 로드하여
@@ -23,6 +34,29 @@ def load_config(path: str) -> dict:
         dict:
             YAML 파일 내용을 파싱한 설정 딕셔너리
             (중첩된 dict 구조로 반환)
+
+    캐시:
+        - (절대 경로, mtime, size)가 동일하면 재파싱 없이 캐시된 결과 사용
+        - 호출 측의 수정이 캐시에 반영되지 않도록 항상 deepcopy 본을 반환
+        - load_config.cache_clear()로 캐시 초기화 가능
     """
-    with open(path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
\ No newline at end of file
+    key = os.path.abspath(path)
+    st = os.stat(key)
+
+    hit = _cache.get(key)
+    if hit is not None and hit[0] == st.st_mtime and hit[1] == st.st_size:
+        _cache.move_to_end(key)
+        return copy.deepcopy(hit[2])
+
+    with open(key, "r", encoding="utf-8") as f:
+        parsed = yaml.load(f, Loader=_Loader)
+
+    _cache[key] = (st.st_mtime, st.st_size, parsed)
+    _cache.move_to_end(key)
+    if len(_cache) > _CACHE_MAX:
+        _cache.popitem(last=False)
+
+    return copy.deepcopy(parsed)
+
+
+load_config.cache_clear = _cache.clear
@@ -1,3 +1,5 @@
+import logging
+
 from config.config import load_config
 from src.data.pill_dataset_builder import PillDatasetBuilder
 from src.mapping.category_mapper import CategoryMapper
@@ -48,9 +50,13 @@ class Pipeline:
                 config.yaml 파일의 경로
 
         초기화 시 수행 작업:
+            - 콘솔 logging 설정
             - config 파일 로드
             - 전 단계에서 공통으로 사용될 설정 객체 생성
         """
+        # 각 모듈의 logging 출력을 콘솔로 (이미 설정된 경우 유지)
+        logging.basicConfig(level=logging.INFO, format="%(message)s")
+
         print(f"[Pipeline] Loading config → {config_path}")
         self.config = load_config(config_path)
 
@@ -1,10 +1,106 @@
 import os
-import json
-import glob
+import logging
 import shutil
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import re
 
+from src.utils.json_io import load_json, dump_json
+
+log = logging.getLogger(__name__)
+
+# stat/링크 등 syscall 위주의 I/O 작업용 스레드 수 (CPU 연산이 아니므로 코어 수보다 크게 설정)
+_IO_WORKERS = (os.cpu_count() or 1) * 4
+
+# 이미지 파일명 패턴: K-<알약 ID들>_<촬영 정보>.png
+_PILL_RE = re.compile(r"^K-(?P<ids>[0-9-]+)_(?P<rest>[^.]+)\.png$")
+
+
+def _scan_names(path):
+    """
+    디렉토리 내 엔트리 이름 집합을 반환합니다. (디렉토리가 없으면 None)
+
+    파일마다 isfile/isdir stat을 호출하는 대신, 디렉토리 1회 열거로 존재 여부를 판단하기 위해 사용합니다.
+    """
+    try:
+        with os.scandir(path) as it:
+            return frozenset(e.name for e in it)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def _list_files(dir_path, suffix):
+    """
+    dir_path 바로 아래에서 suffix로 끝나는 파일 경로 목록을 반환합니다.
+
+    glob.glob(os.path.join(dir_path, "*" + suffix))와 같은 결과(숨김 파일 제외)를
+    os.scandir 1회 열거로 얻습니다. (DirEntry의 d_type 캐시를 사용하므로 추가 stat 없음)
+    """
+    try:
+        with os.scandir(dir_path) as it:
+            return [
+                e.path for e in it
+                if e.name.endswith(suffix) and not e.name.startswith(".") and e.is_file()
+            ]
+    except FileNotFoundError:
+        return []
+
+
+def _merge_one_folder(folder_path, out_path):
+    """
+    이미지 1장에 대한 pill 단위 JSON들을 하나의 COCO JSON으로 병합하여 저장합니다.
+
+    PillDatasetBuilder.merge_annotations에서 폴더 단위로 병렬 호출되는 작업 단위입니다.
+    병합 규칙은 merge_annotations의 설명을 따릅니다.
+
+    Args:
+        folder_path (str): pill 단위 JSON들이 들어있는 이미지별 폴더 경로
+        out_path (str): 병합된 JSON을 저장할 파일 경로
+
+    Returns:
+        bool: 병합 파일을 저장했으면 True, 폴더에 JSON이 없으면 False
+    """
+    json_files = _list_files(folder_path, ".json")
+    if not json_files:
+        return False
+
+    merged = {"images": [], "annotations": [], "categories": []}
+    category_map = {}
+    ann_id = 1
+    image_id = None  # 원본 JSON에서 가져올 값
+
+    for jp in json_files:
+        data = load_json(jp)
+
+        # 첫 JSON에서 image_id를 추출
+        if image_id is None:
+            image_id = data["images"][0]["id"]
+
+            merged["images"].append({
+                "id": image_id,
+                "file_name": data["images"][0]["file_name"],
+                "width": data["images"][0]["width"],
+                "height": data["images"][0]["height"]
+            })
+
+        # category 병합 (category_map 조회로 id당 O(1) 중복 제거)
+        for cat in data.get("categories", []):
+            if cat["id"] not in category_map:
+                category_map[cat["id"]] = cat
+                merged["categories"].append(cat)
+
+        # annotation 병합 (data는 이 파일 전용으로 새로 파싱된 객체이므로 복사 없이 직접 수정)
+        for ann in data.get("annotations", []):
+            ann["id"] = ann_id
+            ann["image_id"] = image_id  # 원본 이미지 ID 유지
+            merged["annotations"].append(ann)
+            ann_id += 1
+
+    # 저장 (기계가 읽는 파일이므로 들여쓰기 없이 저장)
+    # 내용이 같으면 다시 쓰지 않아 mtime 유지 (재실행 시 CategoryMapper 캐시가 유효하게 남음)
+    dump_json(merged, out_path, only_if_changed=True)
+    return True
 
 
 class PillDatasetBuilder:
@@ -87,6 +183,9 @@ class PillDatasetBuilder:
         self.coco_label_dir = os.path.join(self.coco_dir, coco["labels"])
         self.coco_mismatched_label_dir = os.path.join(self.coco_dir, coco["mismatched_labels"])
 
+        # annotation 디렉토리 목록 캐시 (원본 annotation은 처리 중 변경되지 않음)
+        self._list_dir = lru_cache(maxsize=None)(_scan_names)
+
         # 디렉토리 생성
         self._make_dirs()
         
@@ -130,7 +229,41 @@ class PillDatasetBuilder:
             for d in dirs:
                 os.makedirs(d, exist_ok=True)
 
-            
+
+    # 파일 배치 (hardlink 우선, 실패 시 복사)
+    def _place(self, src, dst):
+        """
+        원본 파일을 대상 경로에 배치합니다.
+
+        이미지/JSON 원본은 이후 단계에서 수정되지 않으므로, 바이트를 복사하는 대신
+        같은 파일시스템 내에서는 hardlink(os.link)로 연결합니다.
+        hardlink가 불가능한 경우(다른 파일시스템, 미지원 OS 등)에는 shutil.copy2로 복사합니다.
+
+        특징:
+            - 대상 파일이 이미 존재하면 제거 후 다시 배치 (재실행 시 덮어쓰기 동작 유지)
+
+        Args:
+            src (str): 원본 파일 경로
+            dst (str): 배치할 대상 파일 경로
+
+        Returns:
+            None
+        """
+        try:
+            os.link(src, dst)
+            return
+        except FileExistsError:
+            os.unlink(dst)
+            try:
+                os.link(src, dst)
+                return
+            except OSError:
+                pass
+        except (OSError, AttributeError):
+            pass
+
+        shutil.copy2(src, dst)
+
     # 이미지명에서 알약 ID 추출
     def extract_pill_ids(self, img_name):
         """
@@ -154,8 +287,14 @@ class PillDatasetBuilder:
                 id_part (str): 'K-' 제거 후 하이픈으로 이어진 알약 ID 문자열
                 stem (str): 확장자를 제거한 이미지 파일명
         """
-        img_stem = img_name.replace(".png", "")
-        id_part = img_stem.split("_")[0].replace("K-", "")
+        m = _PILL_RE.match(img_name)
+        if m is not None:
+            id_part = m["ids"]
+            img_stem = f"K-{id_part}_{m['rest']}"
+        else:
+            # 표준 패턴이 아닌 파일명은 기존 문자열 처리 방식으로 분리
+            img_stem = img_name.replace(".png", "")
+            id_part = img_stem.split("_")[0].replace("K-", "")
         pill_ids = id_part.split("-")
         return pill_ids, id_part, img_stem
     
@@ -178,6 +317,74 @@ class PillDatasetBuilder:
         """
         return os.path.join(self.ann_dir, f"K-{id_part}_json")
     
+    # 이미지 1장에 대응하는 pill JSON 탐색
+    def _find_jsons(self, pill_ids, id_part, img_stem):
+        """
+        이미지 1장에 대응하는 pill 단위 JSON 파일들을 찾습니다.
+
+        Args:
+            pill_ids (list[str]): 이미지에 포함된 알약 ID 리스트
+            id_part (str): 하이픈으로 이어진 알약 ID 문자열
+            img_stem (str): 확장자를 제거한 이미지 파일명
+
+        Returns:
+            list[tuple[str, str]] | None:
+                존재하는 (pid, json_path) 리스트.
+                annotation 폴더 자체가 없으면 None
+        """
+        ann_folder = self.get_ann_folder(id_part)
+
+        # annotation 폴더 존재 여부 확인
+        if self._list_dir(ann_folder) is None:
+            return None
+
+        # 개별 pill ID의 JSON 파일 여부 체크 (pill 폴더 목록 캐시 조회)
+        json_name = f"{img_stem}.json"
+        found = []
+        for pid in pill_ids:
+            pill_folder = os.path.join(ann_folder, f"K-{pid}")
+            names = self._list_dir(pill_folder)
+            if names and json_name in names:
+                found.append((pid, os.path.join(pill_folder, json_name)))
+        return found
+
+    # 이미지 1장 분류
+    def _classify_one(self, img_path):
+        """
+        이미지 1장을 분류하고 해당 그룹 폴더에 배치합니다.
+
+        classify_image에서 스레드 단위로 호출되는 작업 단위입니다.
+
+        Args:
+            img_path (str): 분류할 이미지 파일 경로
+
+        Returns:
+            tuple:
+                img_name (str): 이미지 파일명
+                img_stem (str): 확장자를 제거한 이미지 파일명
+                group (str): "matched" / "mismatched" / "no_ann" 중 하나
+                found (list[tuple[str, str]] | None): _find_jsons 결과
+        """
+        img_name = os.path.basename(img_path)
+        pill_ids, id_part, img_stem = self.extract_pill_ids(img_name)
+
+        found = self._find_jsons(pill_ids, id_part, img_stem)
+        found_json = len(found) if found else 0
+
+        # 이미지 분류
+        if found_json == len(pill_ids):
+            # 완전한 매칭
+            group, out_dir = "matched", self.matched_img_dir
+        elif found_json == 0:
+            # 아예 annotation 없음
+            group, out_dir = "no_ann", self.no_ann_img_dir
+        else:
+            # 일부 pill의 annotation 없음
+            group, out_dir = "mismatched", self.mismatched_img_dir
+
+        self._place(img_path, os.path.join(out_dir, img_name))
+        return img_name, img_stem, group, found
+
     # 이미지 분류
     def classify_image(self):
         """
@@ -201,59 +408,147 @@ class PillDatasetBuilder:
             - mismatched_img_dir
             - no_ann_img_dir
 
-        또한, 분류 결과(개수)를 출력합니다.
+        또한, 분류 결과(개수)를 로그로 남깁니다.
 
         Args:
             None
 
         Returns:
-            None
+            dict[str, list[tuple[str, str]]]:
+                img_stem → 발견된 (pid, json_path) 리스트.
+                collect_annotations에 전달하면 JSON 탐색을 다시 하지 않습니다.
         """
-        train_images = glob.glob(os.path.join(self.img_dir, "*.png"))
-        
-        matched = []
-        mismatched = []
-        no_ann = []
-        
-        for img_path in train_images:
-            img_name = os.path.basename(img_path)
-            pill_ids, id_part, img_stem = self.extract_pill_ids(img_name)
-            
-            ann_folder = self.get_ann_folder(id_part)
-            found_json = 0
-            
-            # annotation 폴더 존재 여부 확인
-            if os.path.isdir(ann_folder):
-                # 개별 pill ID의 JSON 파일 여부 체크
-                for pid in pill_ids:
-                    pill_folder = os.path.join(ann_folder, f"K-{pid}")
-                    json_path = os.path.join(pill_folder, f"{img_stem}.json")
-                    if os.path.isfile(json_path):
-                        found_json += 1
-        
-            # 이미지 분류
-            if found_json == len(pill_ids):
-                # 완전한 매칭
-                matched.append(img_name)
-                shutil.copy2(img_path, os.path.join(self.matched_img_dir, img_name))
-            elif found_json == 0:
-                # 아예 annotation 없음
-                no_ann.append(img_name)
-                shutil.copy2(img_path, os.path.join(self.no_ann_img_dir, img_name))
-            else:
-                # 일부 pill의 annotation 없음
-                mismatched.append(img_name)
-                shutil.copy2(img_path, os.path.join(self.mismatched_img_dir, img_name))
-        
+        train_images = _list_files(self.img_dir, ".png")
+
+        # 이미지 간 의존성이 없고 stat/링크 syscall 위주이므로 스레드로 병렬 처리
+        with ThreadPoolExecutor(max_workers=_IO_WORKERS) as ex:
+            results = list(ex.map(self._classify_one, train_images))
+
+        return self._summarize_classification(results)
+
+    # 분류 결과 집계
+    def _summarize_classification(self, results):
+        """
+        _classify_one 결과 목록을 집계하여 그룹별 개수를 로그로 남깁니다.
+
+        Args:
+            results (list[tuple]): _classify_one 반환값 리스트
+
+        Returns:
+            dict[str, list[tuple[str, str]]]: img_stem → 발견된 (pid, json_path) 리스트
+        """
+        matched = [r[0] for r in results if r[2] == "matched"]
+        mismatched = [r[0] for r in results if r[2] == "mismatched"]
+        no_ann = [r[0] for r in results if r[2] == "no_ann"]
+        found_jsons = {r[1]: r[3] for r in results if r[3] is not None}
+
         # 결과 출력
-        print("====== 이미지 분류 결과 ======")
-        print("Matched:", len(matched))
-        print("Mismatched:", len(mismatched))
-        print("No annotation:", len(no_ann))
-        print("==============================")
+        log.info(
+            "이미지 분류 결과 - Matched: %d, Mismatched: %d, No annotation: %d",
+            len(matched), len(mismatched), len(no_ann),
+        )
+
+        return found_jsons
+
+    # pill JSON 배치
+    def _place_jsons(self, found, img_out_dir):
+        """
+        찾은 pill 단위 JSON들을 img_out_dir/<pid>.json 형태로 배치합니다.
+
+        Args:
+            found (list[tuple[str, str]]): (pid, json_path) 리스트
+            img_out_dir (str): 이미지별 annotation 출력 폴더
+
+        Returns:
+            None
+        """
+        os.makedirs(img_out_dir, exist_ok=True)
+
+        for pid, json_path in found:
+            self._place(json_path, os.path.join(img_out_dir, f"{pid}.json"))
+
+    # 이미지 1장 분류 + annotation 수집 + COCO 이미지 배치
+    def _process_one(self, img_path):
+        """
+        이미지 1장에 대해 분류, annotation 수집, COCO 이미지 배치를 한 번에 수행합니다.
+
+        classify_and_collect에서 스레드 단위로 호출되는 작업 단위입니다.
+
+        Args:
+            img_path (str): 원본 이미지 파일 경로
+
+        Returns:
+            tuple: _classify_one 반환값과 동일
+        """
+        result = self._classify_one(img_path)
+        img_name, img_stem, group, found = result
+
+        if group == "matched":
+            out_ann_dir, coco_img_dir = self.matched_ann_dir, self.coco_img_dir
+        elif group == "mismatched":
+            out_ann_dir, coco_img_dir = self.mismatched_ann_dir, self.coco_mismatched_img_dir
+        else:
+            return result
+
+        self._place_jsons(found, os.path.join(out_ann_dir, img_stem))
+        self._place(img_path, os.path.join(coco_img_dir, img_name))
+        return result
+
+    # 이미지 분류 + annotation 수집 + COCO 이미지 배치 (단일 패스)
+    def classify_and_collect(self):
+        """
+        원본 이미지 디렉토리를 한 번만 순회하며 분류, annotation 수집, COCO 이미지 배치를 수행합니다.
+
+        classify_image → collect_annotations → copy_*_images_to_coco 를 차례로 실행한 것과
+        같은 결과를 만들지만, 이미지 디렉토리를 세 번 다시 읽지 않고 이미지당 한 번에 처리합니다.
+
+        처리 내용 (이미지 1장 기준):
+            - matched / mismatched / no annotation 분류 후 filtered 폴더에 배치
+            - matched, mismatched 이미지의 pill JSON을 이미지별 annotation 폴더에 배치
+            - matched 이미지는 coco/images, mismatched 이미지는 coco/mismatched_images에 배치
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        train_images = _list_files(self.img_dir, ".png")
+
+        # 이미지 간 의존성이 없고 stat/링크 syscall 위주이므로 스레드로 병렬 처리
+        with ThreadPoolExecutor(max_workers=_IO_WORKERS) as ex:
+            results = list(ex.map(self._process_one, train_images))
+
+        self._summarize_classification(results)
     
+    # 이미지 1장의 annotation 수집
+    def _collect_one(self, img_path, out_ann_dir, found_jsons=None):
+        """
+        이미지 1장에 대응하는 pill 단위 JSON들을 out_ann_dir/<img_stem>/ 아래에 배치합니다.
+
+        collect_annotations에서 스레드 단위로 호출되는 작업 단위입니다.
+
+        Args:
+            img_path (str): 기준 이미지 파일 경로
+            out_ann_dir (str): 매칭된 JSON 어노테이션을 저장할 출력 디렉토리
+            found_jsons (dict | None): classify_image의 반환값. 없으면 직접 탐색
+
+        Returns:
+            None
+        """
+        img_name = os.path.basename(img_path)
+        pill_ids, id_part, img_stem = self.extract_pill_ids(img_name)
+
+        found = found_jsons.get(img_stem) if found_jsons else None
+        if found is None:
+            found = self._find_jsons(pill_ids, id_part, img_stem)
+            if found is None:
+                return
+
+        self._place_jsons(found, os.path.join(out_ann_dir, img_stem))
+
     # annotation 파일 수집
-    def collect_annotations(self, src_img_dir, out_ann_dir):
+    def collect_annotations(self, src_img_dir, out_ann_dir, found_jsons=None):
         """
         이미지 목록을 기준으로 관련된 어노테이션(JSON) 파일들을 수집하여 출력 폴더에 정리합니다.
 
@@ -265,6 +560,7 @@ class PillDatasetBuilder:
             2. 해당 이미지에 대응하는 어노테이션 폴더(K-id_part_json) 탐색
             3. 이미지마다 저장될 출력 폴더(out_ann_dir/<img_stem>) 생성
             4. pill_ids 별로 JSON 존재 여부 확인 후, 존재하면 pid.json 형태로 복사
+               (found_jsons가 주어지면 classify_image에서 찾은 경로를 그대로 사용)
 
         예시:
             이미지:  
@@ -280,26 +576,18 @@ class PillDatasetBuilder:
         Args:
             src_img_dir (str): 원본 이미지들이 위치한 디렉토리 경로.
             out_ann_dir (str): 매칭된 JSON 어노테이션을 저장할 출력 디렉토리.
+            found_jsons (dict | None):
+                classify_image가 반환한 img_stem → (pid, json_path) 리스트.
+                None이거나 해당 이미지가 없으면 annotation 폴더를 직접 탐색합니다.
 
         Returns:
             None
         """
-        for img_path in glob.glob(os.path.join(src_img_dir, "*.png")): 
-            img_name = os.path.basename(img_path) 
-            pill_ids, id_part, img_stem = self.extract_pill_ids(img_name) 
-            
-            ann_root = self.get_ann_folder(id_part) 
-            if not os.path.isdir(ann_root): 
-                continue 
-            
-            img_out_dir = os.path.join(out_ann_dir, img_stem) 
-            os.makedirs(img_out_dir, exist_ok=True) 
-            
-            for pid in pill_ids: 
-                pill_folder = os.path.join(ann_root, f"K-{pid}") 
-                json_path = os.path.join(pill_folder, f"{img_stem}.json") 
-                if os.path.isfile(json_path): 
-                    shutil.copy2(json_path, os.path.join(img_out_dir, f"{pid}.json"))
+        img_paths = _list_files(src_img_dir, ".png")
+
+        # 이미지별 수집 작업은 서로 독립적이므로 스레드로 병렬 처리
+        with ThreadPoolExecutor(max_workers=_IO_WORKERS) as ex:
+            list(ex.map(lambda p: self._collect_one(p, out_ann_dir, found_jsons), img_paths))
 
     # 이미지별 하나로 json 병합
     def merge_annotations(self, src_root, out_dir):
@@ -341,59 +629,20 @@ class PillDatasetBuilder:
         Returns:
             None
         """
-        merged_count = 0
-
-        for img_folder in os.listdir(src_root):
-            folder_path = os.path.join(src_root, img_folder)
-            if not os.path.isdir(folder_path):
-                continue
-
-            json_files = glob.glob(os.path.join(folder_path, "*.json"))
-            if not json_files:
-                continue
-
-            merged = {"images": [], "annotations": [], "categories": []}
-            category_map = {}
-            ann_id = 1
-            image_id = None  # 원본 JSON에서 가져올 값
-
-            for jp in json_files:
-                with open(jp, encoding="utf-8") as f:
-                    data = json.load(f)
-
-                # 첫 JSON에서 image_id를 추출
-                if image_id is None:
-                    image_id = data["images"][0]["id"]
-
-                    merged["images"].append({
-                        "id": image_id,
-                        "file_name": data["images"][0]["file_name"],
-                        "width": data["images"][0]["width"],
-                        "height": data["images"][0]["height"]
-                    })
-
-                # category 병합
-                for cat in data.get("categories", []):
-                    if cat["id"] not in category_map:
-                        category_map[cat["id"]] = cat
-                        merged["categories"].append(cat)
-
-                # annotation 병합
-                for ann in data.get("annotations", []):
-                    new_ann = ann.copy()
-                    new_ann["id"] = ann_id
-                    new_ann["image_id"] = image_id  # 원본 이미지 ID 유지
-                    merged["annotations"].append(new_ann)
-                    ann_id += 1
-
-            # 저장
-            out_path = os.path.join(out_dir, f"{img_folder}.json")
-            with open(out_path, "w", encoding="utf-8") as f:
-                json.dump(merged, f, ensure_ascii=False, indent=2)
-
-            merged_count += 1
-
-        print(f"{merged_count}개 이미지의 annotation 병합 완료!")
+        folder_paths = []
+        out_paths = []
+        with os.scandir(src_root) as it:
+            for entry in it:
+                if not entry.is_dir():
+                    continue
+                folder_paths.append(entry.path)
+                out_paths.append(os.path.join(out_dir, f"{entry.name}.json"))
+
+        # 이미지 폴더별 병합은 서로 독립적이므로 스레드로 병렬 처리
+        with ThreadPoolExecutor(max_workers=_IO_WORKERS) as ex:
+            merged_count = sum(ex.map(_merge_one_folder, folder_paths, out_paths))
+
+        log.info("%d개 이미지의 annotation 병합 완료!", merged_count)
         
     def copy_matched_images_to_coco(self):
         """
@@ -406,7 +655,7 @@ class PillDatasetBuilder:
         수행 과정:
             1. matched_img_dir 에서 *.png 파일을 모두 탐색
             2. 파일명을 유지한 채 coco_style_img_dir 로 복사
-            3. 덮어쓰기가 가능한 shutil.copy2 사용 (메타데이터 포함 복사)
+            3. _place 사용 (hardlink 우선, 불가 시 shutil.copy2로 복사)
             4. 모든 복사 작업 완료 후 로그 출력
 
         사용 목적:
@@ -419,14 +668,14 @@ class PillDatasetBuilder:
         Returns:
             None
         """
-        for img_path in glob.glob(os.path.join(self.matched_img_dir, "*.png")):
+        for img_path in _list_files(self.matched_img_dir, ".png"):
             img_name = os.path.basename(img_path)
-            shutil.copy2(
+            self._place(
                 img_path,
                 os.path.join(self.coco_img_dir, img_name)
             )
 
-        print(f"matched_images → coco_style/images 복사 완료!")
+        log.info("matched_images → coco_style/images 복사 완료!")
         
     
     def copy_mismatched_images_to_coco(self):
@@ -441,7 +690,7 @@ class PillDatasetBuilder:
         수행 과정:
             1. mismatched_img_dir 내부의 모든 PNG 파일 탐색
             2. 파일 이름을 유지한 채 coco_style_mismatched_img_dir 로 복사
-            3. shutil.copy2를 사용하여 메타데이터 포함하여 복사
+            3. _place를 사용하여 배치 (hardlink 우선, 불가 시 복사)
             4. 복사 완료 시 로그 출력
 
         사용 목적:
@@ -454,14 +703,14 @@ class PillDatasetBuilder:
         Returns:
             None
         """
-        for img_path in glob.glob(os.path.join(self.mismatched_img_dir, "*.png")):
+        for img_path in _list_files(self.mismatched_img_dir, ".png"):
             img_name = os.path.basename(img_path)
-            shutil.copy2(
+            self._place(
                 img_path,
                 os.path.join(self.coco_mismatched_img_dir, img_name)
             )
 
-        print(f"mismatched_images → coco_style/mismatched_images 복사 완료!")
+        log.info("mismatched_images → coco_style/mismatched_images 복사 완료!")
 
      
     def run(self):
@@ -473,25 +722,20 @@ class PillDatasetBuilder:
         COCO 형식의 학습용 데이터셋을 완성합니다.
 
         실행 흐름:
-            STEP 1) 이미지 분류
+            STEP 1) 이미지 분류 + annotation 수집 + COCO style 이미지 배치 (단일 패스)
                 - 이미지 파일명 기반으로 알약 ID 추출
                 - annotation 존재 여부에 따라
                 matched / mismatched / no annotation 이미지로 분류
-
-            STEP 2) annotation 수집
                 - matched, mismatched 이미지에 대해
-                개별 pill 단위 JSON annotation 파일 수집
-                - 이미지별 폴더 구조로 정리
+                개별 pill 단위 JSON annotation 파일을 이미지별 폴더 구조로 정리
+                - matched 이미지를 COCO 학습용 images 디렉토리로,
+                mismatched 이미지를 별도 COCO 폴더로 배치
 
-            STEP 3) annotation 병합
+            STEP 2) annotation 병합
                 - 이미지 단위로 분리된 여러 JSON 파일을
                 하나의 COCO 형식 JSON으로 병합
                 - matched / mismatched 데이터를 각각 독립적으로 처리
 
-            STEP 4) COCO style 이미지 복사
-                - matched 이미지를 COCO 학습용 images 디렉토리로 복사
-                - mismatched 이미지를 별도 COCO 폴더로 분리 저장
-
         출력 결과:
             - processed/coco/images           : 학습용 clean 이미지
             - processed/coco/labels           : 병합된 COCO annotation JSON
@@ -509,19 +753,11 @@ class PillDatasetBuilder:
         Returns:
             None
         """
-        print("\n===== STEP 1: 이미지 분류 =====")
-        self.classify_image()
-
-        print("\n===== STEP 2: annotation 수집 =====")
-        self.collect_annotations(self.matched_img_dir, self.matched_ann_dir)
-        self.collect_annotations(self.mismatched_img_dir, self.mismatched_ann_dir)
+        log.info("===== STEP 1: 이미지 분류 / annotation 수집 / COCO style 이미지 배치 =====")
+        self.classify_and_collect()
 
-        print("\n===== STEP 3: annotation 병합 =====")
+        log.info("===== STEP 2: annotation 병합 =====")
         self.merge_annotations(self.matched_ann_dir, self.coco_label_dir)
         self.merge_annotations(self.mismatched_ann_dir, self.coco_mismatched_label_dir)
         
-        print("\n===== STEP 4: COCO style 이미지 복사 =====")
-        self.copy_matched_images_to_coco()
-        self.copy_mismatched_images_to_coco()
-        
-        print("🎉 모든 처리 완료!")
\ No newline at end of file
+        log.info("🎉 모든 처리 완료!")
\ No newline at end of file
@@ -1,5 +1,36 @@
-import json
 import os
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from src.utils.json_io import load_json, dump_json
+
+try:
+    import ijson  # 설치된 경우 C 백엔드(yajl2_c)를 자동 선택
+except ImportError:  # ijson 미설치 환경에서는 파일 전체를 파싱
+    ijson = None
+
+
+def _load_cats(path: str) -> dict:
+    """
+    COCO JSON 파일 하나에서 categories 정보만 추출합니다.
+
+    ijson이 설치되어 있으면 "categories" 배열만 스트리밍으로 읽어,
+    용량 대부분을 차지하는 annotations 배열은 객체로 만들지 않고 건너뜁니다.
+
+    Args:
+        path (str): COCO annotation JSON 파일 경로
+
+    Returns:
+        dict: {category_id(int): name}
+    """
+    if ijson is not None:
+        with open(path, "rb") as f:
+            return {int(cat["id"]): cat["name"] for cat in ijson.items(f, "categories.item")}
+
+    data = load_json(path)
+    return {int(cat["id"]): cat["name"] for cat in data.get("categories", [])}
 
 
 class CategoryMapper:
@@ -13,7 +44,7 @@ class CategoryMapper:
     핵심 특징:
         - category_id 기준 정렬을 통해 실행 환경과 무관한 동일 매핑 보장
         - COCO ↔ YOLO 간 양방향 변환 지원
-        - 매핑 결과를 JSON 파일로 저장 및 재사용 가능
+        - 매핑 결과를 파일(pickle / JSON)로 저장 및 재사용 가능
 
     사용 목적:
         - 학습(train), 추론(inference), 결과 복원(post-processing) 전 과정에서
@@ -61,6 +92,13 @@ class CategoryMapper:
         self.yolo_to_category = {}  # {yolo_id: category_id}
         self.yolo_names = []        # index = yolo_id
 
+        # 매핑 생성에 사용한 입력 정보 (label 디렉토리 절대 경로, JSON 개수) — 캐시 유효성 확인용
+        self.source = None
+
+        # 배치 변환용 LUT (매핑 생성/로드 시 갱신)
+        self._y2c = np.empty(0, dtype=np.int32)  # index = yolo_id → category_id
+        self._c2y = np.empty(0, dtype=np.int32)  # index = category_id → yolo_id (없으면 -1)
+
  
     def build_from_coco_folder(self, coco_label_dir: str | None = None):
         """
@@ -89,7 +127,13 @@ class CategoryMapper:
 
         Side Effects:
             - 내부 매핑 정보(category_to_yolo, yolo_to_category, yolo_names) 갱신
-            - 매핑 결과를 JSON 파일로 저장
+            - 매핑 결과를 파일로 저장 (save)
+
+        캐시:
+            - save_path의 매핑 파일이 같은 label 디렉토리(및 같은 JSON 개수)로 생성되었고,
+            label 디렉토리 및 모든 JSON보다 최신이면 재생성하지 않고 그대로 사용합니다.
+            (PillDatasetBuilder의 병합 단계는 내용이 같은 JSON을 다시 쓰지 않으므로
+            데이터가 바뀌지 않은 파이프라인 재실행에서도 캐시가 유지됩니다.)
         """
         coco_label_dir = coco_label_dir or self.coco_label_dir
     
@@ -98,20 +142,27 @@ class CategoryMapper:
                 f"[CategoryMapper] COCO label 디렉토리 없음: {coco_label_dir}"
             )        
 
-        category_dict = {}  # {category_id: name}
+        # 저장된 매핑이 같은 디렉토리에서 생성되었고 모든 COCO JSON보다 최신이면 재생성 없이 사용
+        cached = self._load_fresh_cache(coco_label_dir)
+        if cached is not None:
+            self._set_mapping(cached)
+            print(f"[CategoryMapper] 매핑 로드 완료 ← {self.save_path}")
+            return
 
-        for filename in os.listdir(coco_label_dir):
-            if not filename.endswith(".json"):
-                continue
+        category_dict = {}  # {category_id: name}
 
-            path = os.path.join(coco_label_dir, filename)
-            with open(path, encoding="utf-8") as f:
-                data = json.load(f)
+        paths = [
+            os.path.join(coco_label_dir, filename)
+            for filename in os.listdir(coco_label_dir)
+            if filename.endswith(".json")
+        ]
+        self.source = (os.path.abspath(coco_label_dir), len(paths))
 
-            for cat in data.get("categories", []):
-                cid = int(cat["id"])
-                name = cat["name"]
-                category_dict[cid] = name
+        # 파일별 읽기는 서로 독립적이므로 스레드로 병렬 처리
+        # (결과 병합은 파일 순서대로 하여, 같은 id는 뒤 파일의 name이 우선)
+        with ThreadPoolExecutor() as ex:
+            for cats in ex.map(_load_cats, paths):
+                category_dict.update(cats)
 
         if not category_dict:
             raise ValueError("[CategoryMapper] categories를 찾을 수 없습니다.")
@@ -127,19 +178,65 @@ class CategoryMapper:
             self.yolo_to_category[idx] = cid
             self.yolo_names.append(name)
 
+        self._build_arrays()
         self.save()
 
         print(f"[CategoryMapper] 총 {len(self.yolo_names)}개 카테고리 매핑 완료")
 
 
+    def _load_fresh_cache(self, coco_label_dir: str):
+        """
+        저장된 매핑 파일이 같은 COCO label 데이터로 생성되었고, 그보다 최신이면 그 내용을 반환합니다.
+
+        매핑 파일에 기록된 label 디렉토리 절대 경로와 JSON 개수가 현재 입력과 같아야 하며,
+        디렉토리 자체의 mtime도 함께 비교하여 JSON 파일 삭제/추가도 감지합니다.
+        (입력 정보가 기록되지 않은 JSON / 이전 버전 매핑 파일은 재사용하지 않음)
+
+        Args:
+            coco_label_dir (str): COCO annotation JSON 파일들이 위치한 디렉토리
+
+        Returns:
+            tuple | None: 재사용 가능하면 save()로 저장한 pickle 내용, 아니면 None
+        """
+        if self.save_path.endswith(".json"):
+            return None
+
+        try:
+            cache_mtime = os.path.getmtime(self.save_path)
+            with open(self.save_path, "rb") as f:
+                data = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+
+        with os.scandir(coco_label_dir) as it:
+            json_mtimes = [e.stat().st_mtime for e in it if e.name.endswith(".json")]
+
+        # JSON이 하나도 없으면 기존처럼 전체 스캔 경로에서 에러 처리
+        if not json_mtimes:
+            return None
+
+        # 다른 디렉토리(또는 다른 JSON 개수)로 생성된 매핑이면 재생성
+        source = data[3] if len(data) > 3 else None
+        if source != (os.path.abspath(coco_label_dir), len(json_mtimes)):
+            return None
+
+        src_mtime = max(max(json_mtimes), os.path.getmtime(coco_label_dir))
+        return data if cache_mtime >= src_mtime else None
+
+
     def save(self, path: str | None = None):
         """
-        생성된 category ↔ YOLO 매핑 정보를 JSON 파일로 저장합니다.
+        생성된 category ↔ YOLO 매핑 정보를 pickle 파일로 저장합니다.
+
+        파이프라인 실행 시마다 다시 읽는 파일이므로,
+        JSON 대비 역직렬화가 빠르고 int key를 그대로 보존하는 pickle 형식을 사용합니다.
+        (사람이 확인할 용도라면 save_json 사용, 경로 확장자가 .json이면 save_json으로 저장)
 
         저장되는 정보:
             - category_to_yolo
             - yolo_to_category
             - yolo_names
+            - source (매핑 생성에 사용한 label 디렉토리 절대 경로, JSON 개수)
 
         Args:
             path (str | None):
@@ -154,6 +251,33 @@ class CategoryMapper:
         if path is None:
             raise ValueError("save_path가 지정되지 않았습니다.")
         
+        if path.endswith(".json"):
+            self.save_json(path, pretty=False)
+            return
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        data = (self.category_to_yolo, self.yolo_to_category, self.yolo_names, self.source)
+
+        with open(path, "wb") as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        print(f"[CategoryMapper] 매핑 저장 완료 → {path}")
+
+
+    def save_json(self, path: str | None = None, pretty: bool = True):
+        """
+        매핑 정보를 사람이 확인할 수 있는 JSON 파일로 저장합니다.
+
+        Args:
+            path (str | None):
+                JSON 파일을 저장할 경로.
+                None일 경우 save_path의 확장자를 .json으로 바꾼 경로를 사용합니다.
+            pretty (bool):
+                True이면 들여쓰기하여 저장합니다.
+        """
+        path = path or os.path.splitext(self.save_path)[0] + ".json"
+        
         os.makedirs(os.path.dirname(path), exist_ok=True)
 
         data = {
@@ -162,40 +286,76 @@ class CategoryMapper:
             "yolo_names": self.yolo_names,
         }
 
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        dump_json(data, path, pretty=pretty)
 
-        print(f"[CategoryMapper] 매핑 저장 완료 → {path}")
+        print(f"[CategoryMapper] 매핑 JSON 저장 완료 → {path}")
 
 
     def load(self, path: str | None = None):
         """
-        저장된 category ↔ YOLO 매핑 JSON 파일을 로드합니다.
+        저장된 category ↔ YOLO 매핑 파일을 로드합니다.
 
-        JSON 파일에 저장된 문자열 key를
-        내부적으로 int 타입으로 복원하여 사용합니다.
+        save()로 저장한 pickle 파일을 기본으로 읽으며,
+        확장자가 .json인 경우(save_json 또는 이전 버전에서 저장한 파일)
+        문자열 key를 int 타입으로 복원하여 사용합니다.
 
         Args:
             path (str | None):
-                매핑 JSON 파일 경로.
+                매핑 파일 경로.
                 None일 경우 초기화 시 설정된 save_path를 사용합니다.
 
         Side Effects:
             - 내부 매핑 정보(category_to_yolo, yolo_to_category, yolo_names) 갱신
         """
         path = path or self.save_path
-        
-        with open(path, encoding="utf-8") as f:
-            data = json.load(f)
 
-        # JSON은 key가 str → int로 복원
-        self.category_to_yolo = {int(k): int(v) for k, v in data["category_to_yolo"].items()}
-        self.yolo_to_category = {int(k): int(v) for k, v in data["yolo_to_category"].items()}
-        self.yolo_names = data["yolo_names"]
+        if path.endswith(".json"):
+            data = load_json(path)
+
+            # JSON은 key가 str → int로 복원
+            self._set_mapping((
+                {int(k): int(v) for k, v in data["category_to_yolo"].items()},
+                {int(k): int(v) for k, v in data["yolo_to_category"].items()},
+                data["yolo_names"],
+            ))
+        else:
+            with open(path, "rb") as f:
+                self._set_mapping(pickle.load(f))
 
         print(f"[CategoryMapper] 매핑 로드 완료 ← {path}")
 
 
+    def _set_mapping(self, data: tuple):
+        """
+        save()로 저장한 pickle 내용으로 내부 매핑과 LUT를 갱신합니다.
+
+        Args:
+            data (tuple): (category_to_yolo, yolo_to_category, yolo_names[, source])
+        """
+        self.category_to_yolo, self.yolo_to_category, self.yolo_names = data[:3]
+        # 이전 버전 pickle(3-tuple)에는 source 정보가 없음
+        self.source = data[3] if len(data) > 3 else None
+
+        self._build_arrays()
+
+
+    def _build_arrays(self):
+        """
+        dict 기반 매핑으로부터 배치 변환용 NumPy LUT를 생성합니다.
+
+        YOLO class_id는 0 ~ N-1의 연속된 정수이므로 배열 인덱스로 바로 조회할 수 있고,
+        category_id는 최대값 크기의 배열(미사용 칸은 -1)로 조회합니다.
+        """
+        self._y2c = np.array(
+            [self.yolo_to_category[i] for i in range(len(self.yolo_names))],
+            dtype=np.int32,
+        )
+
+        max_cid = max(self.category_to_yolo, default=-1)
+        self._c2y = np.full(max_cid + 1, -1, dtype=np.int32)
+        self._c2y[list(self.category_to_yolo)] = list(self.category_to_yolo.values())
+
+
     def yolo_to_category_fn(self, yolo_id: int) -> int:
         """
         YOLO class_id를 COCO category_id로 변환합니다.
@@ -220,3 +380,35 @@ class CategoryMapper:
             int: 대응되는 YOLO class_id
         """
         return self.category_to_yolo[category_id]
+
+
+    def yolo_to_category_array(self, ids) -> np.ndarray:
+        """
+        YOLO class_id 배열을 COCO category_id 배열로 일괄 변환합니다.
+
+        Args:
+            ids (array-like of int): YOLO 모델 출력 class index 배열
+
+        Returns:
+            np.ndarray: 대응되는 COCO category_id 배열 (int32)
+        """
+        return self._y2c[np.asarray(ids, dtype=np.intp)]
+
+
+    def category_to_yolo_array(self, ids) -> np.ndarray:
+        """
+        COCO category_id 배열을 YOLO class_id 배열로 일괄 변환합니다.
+
+        Args:
+            ids (array-like of int): COCO annotation의 category_id 배열
+
+        Returns:
+            np.ndarray: 대응되는 YOLO class_id 배열 (int32, 매핑에 없는 id는 -1)
+        """
+        ids = np.asarray(ids, dtype=np.intp)
+        if len(self._c2y) == 0:
+            return np.full(ids.shape, -1, dtype=np.int32)
+
+        # LUT 범위 밖(음수 / 최대 category_id 초과)은 인덱싱하지 않고 -1 처리
+        valid = (ids >= 0) & (ids < len(self._c2y))
+        return np.where(valid, self._c2y[np.where(valid, ids, 0)], -1).astype(np.int32)
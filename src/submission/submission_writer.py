@@ -1,5 +1,6 @@
 # models/submission_writer.py
 import csv
+import itertools
 import os
 
 
@@ -12,7 +13,7 @@ class SubmissionWriter:
 
     핵심 특징:
         - config.yaml 기반 출력 경로 및 파일명 관리
-        - 이미지 이름 기준 정렬을 통한 결과 재현성 보장
+        - 이미지 번호(파일명의 숫자) 기준 정렬을 통한 결과 재현성 보장
         - annotation_id를 1부터 순차적으로 부여
         - float 타입 bbox 및 score 값을 명시적으로 변환하여 저장
 
@@ -69,7 +70,8 @@ class SubmissionWriter:
         처리 규칙:
             - image_id는 문자열 형태로 저장
             - annotation_id는 1부터 순차 증가
-            - 이미지 이름 기준으로 정렬하여 저장 (재현성 확보)
+            - 파일명의 숫자 기준으로 정렬하여 저장 (재현성 확보)
+              (문자열 정렬 시 "10.png" < "2.png"가 되므로 image_id 순서와 일치시키기 위함)
             - score는 소수점 4자리까지 반올림
 
         Args:
@@ -91,36 +93,33 @@ class SubmissionWriter:
         Returns:
             None
         """
-        rows = []
-        annotation_id = 1
-
-        # 이미지 이름 기준 정렬 (재현성)
-        for img_name in sorted(predictions.keys()):
-            dets = predictions[img_name]
-
-            for det in dets:
-                image_id = str(det["image_id"])
-                category_id = det["category_id"]
-                x, y, w, h = det["bbox"]
-                score = det["score"]
-
-                rows.append([
-                    annotation_id,
-                    image_id,
-                    category_id,
-                    float(x), float(y), float(w), float(h),
-                    round(float(score), 4)
-                ])
-
-                annotation_id += 1
+        # annotation_id: 1부터 순차 증가
+        ann_ids = itertools.count(1)
+        total = 0
 
+        # 전체 행을 메모리에 모으지 않고 이미지 단위로 바로 기록
         with open(self.out_csv, "w", newline="", encoding="utf-8") as f:
             writer = csv.writer(f)
             writer.writerow([
                 "annotation_id", "image_id", "category_id",
                 "bbox_x", "bbox_y", "bbox_w", "bbox_h", "score"
             ])
-            writer.writerows(rows)
-            
-        print(f"[SubmissionWriter] total rows: {len(rows)}")
+
+            # 파일명 숫자 기준 정렬 (재현성, 파일명이 숫자라고 가정)
+            for img_name in sorted(predictions.keys(), key=lambda n: int(os.path.splitext(n)[0])):
+                dets = predictions[img_name]
+
+                writer.writerows(
+                    [
+                        next(ann_ids),
+                        str(det["image_id"]),
+                        det["category_id"],
+                        *map(float, det["bbox"]),
+                        round(float(det["score"]), 4)
+                    ]
+                    for det in dets
+                )
+                total += len(dets)
+
+        print(f"[SubmissionWriter] total rows: {total}")
         print(f"[SubmissionWriter] CSV 저장 완료 → {self.out_csv}")
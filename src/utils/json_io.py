@@ -0,0 +1,87 @@
+# json_io.py
+import json
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 환경에서는 표준 json 모듈 사용
+    orjson = None
+
+
+def load_json(path: str):
+    """
+    JSON 파일을 읽어 파이썬 객체로 반환합니다.
+
+    orjson이 설치되어 있으면 C 구현 파서(orjson.loads)를 사용하고,
+    없으면 표준 json 모듈로 대체합니다.
+
+    Args:
+        path (str): 읽을 JSON 파일 경로
+
+    Returns:
+        파싱된 JSON 객체 (dict / list 등)
+    """
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def dumps_json(obj, pretty: bool = False) -> bytes:
+    """
+    파이썬 객체를 UTF-8 JSON bytes로 직렬화합니다.
+
+    orjson이 설치되어 있으면 orjson.dumps를 사용하고,
+    없으면 표준 json 모듈(ensure_ascii=False)로 대체합니다.
+    int key는 두 경우 모두 문자열 key로 저장됩니다.
+
+    Args:
+        obj: 직렬화할 객체
+        pretty (bool): True이면 2칸 들여쓰기 (사람이 읽기 위한 용도)
+
+    Returns:
+        bytes: UTF-8 JSON
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+
+    if pretty:
+        text = json.dumps(obj, ensure_ascii=False, indent=2)
+    else:
+        text = json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+    return text.encode("utf-8")
+
+
+def dump_json(obj, path: str, pretty: bool = False, only_if_changed: bool = False) -> bool:
+    """
+    파이썬 객체를 UTF-8 JSON 파일로 저장합니다. (직렬화 방식은 dumps_json 참고)
+
+    only_if_changed=True이면 기존 파일 내용과 같을 때 쓰지 않으므로,
+    재실행 시 출력 파일의 mtime이 바뀌지 않아 mtime 기반 캐시를 유지할 수 있습니다.
+
+    Args:
+        obj: 저장할 객체
+        path (str): 저장할 JSON 파일 경로
+        pretty (bool): True이면 2칸 들여쓰기로 저장 (사람이 읽기 위한 용도)
+        only_if_changed (bool): True이면 기존 파일과 내용이 다를 때만 저장
+
+    Returns:
+        bool: 파일을 새로 썼으면 True, 내용이 같아 건너뛰었으면 False
+    """
+    data = dumps_json(obj, pretty=pretty)
+
+    if only_if_changed:
+        try:
+            with open(path, "rb") as f:
+                if f.read() == data:
+                    return False
+        except FileNotFoundError:
+            pass
+
+    with open(path, "wb") as f:
+        f.write(data)
+    return True
@@ -1,7 +1,21 @@
+from concurrent.futures import ThreadPoolExecutor
 from ultralytics import YOLO
+from ultralytics.utils.patches import imread
+import numpy as np
 import os
 import torch
 
+# 추론 대상 이미지 확장자
+_EXTS = (".png", ".jpg", ".jpeg")
+
+
+def _imread(path: str):
+    """이미지를 BGR numpy 배열로 읽습니다. (Ultralytics 파일 로딩과 동일한 imread 사용, 비ASCII 경로 지원)"""
+    image = imread(path)
+    if image is None:
+        raise FileNotFoundError(f"이미지를 읽을 수 없습니다: {path}")
+    return image
+
 class Predictor:
     """
     config.yaml 기반으로 YOLO 모델 추론을 수행하는 클래스입니다.
@@ -12,7 +26,8 @@ class Predictor:
 
     핵심 특징:
         - config(dict) 기반 추론 설정 관리
-        - GPU 사용 가능 시 자동으로 CUDA 사용
+        - GPU 사용 가능 시 자동으로 CUDA 사용 (초기화 시 한 번만 확인하여 캐싱)
+        - 다음 batch 이미지를 스레드 풀에서 미리 디코딩하여 추론과 겹쳐 수행
         - CategoryMapper를 통한 YOLO → COCO category_id 복원
         - 추론 결과를 구조화된 dict 형태로 반환
 
@@ -39,6 +54,8 @@ class Predictor:
                 - inference_args.iou (optional)
                 - inference_args.max_det (optional)
                 - inference_args.save (optional)
+                - inference_args.batch (optional)
+                - inference_args.workers (optional)
                 - paths.base_dir
 
             mapper (CategoryMapper):
@@ -48,6 +65,7 @@ class Predictor:
             - YOLO 모델 로드
             - 추론 대상 이미지 디렉토리 설정
             - confidence / IoU / max_det 등 추론 파라미터 로드
+            - 추론 device 결정 (predict_folder 호출마다 재확인하지 않음)
         """
         self.cfg = config
         self.mapper = mapper
@@ -65,6 +83,11 @@ class Predictor:
         self.iou = infer_cfg.get("iou", 0.7)
         self.max_det = infer_cfg.get("max_det", 10)
         self.save = infer_cfg.get("save", False)
+        self.batch = infer_cfg.get("batch", 16)
+        self.workers = infer_cfg.get("workers", min(8, os.cpu_count() or 1))
+
+        # device (추론마다 재확인하지 않도록 한 번만 결정)
+        self.device = 0 if torch.cuda.is_available() else "cpu"
 
         print(f"[Predictor] model → {self.model_path}")
         print(f"[Predictor] img_dir → {self.img_dir}")
@@ -76,7 +99,7 @@ class Predictor:
 
         수행 내용:
             - 이미지 파일 목록을 정렬하여 순차적으로 처리
-            - 각 이미지에 대해 YOLO 모델 추론 실행
+            - batch 단위로 추론하며, 그동안 다음 batch 이미지를 스레드 풀에서 미리 디코딩
             - 예측된 bounding box 정보를 COCO 형식에 맞게 파싱
             - CategoryMapper를 사용하여 YOLO class_id를 COCO category_id로 변환
 
@@ -108,52 +131,97 @@ class Predictor:
                 해당 이미지의 예측 결과 리스트를 value로 가지는 딕셔너리
         """
         outputs = {}
-        
-        infer_kwargs = {
-            "conf": self.conf,
-            "iou": self.iou,
-            "max_det": self.max_det,
-            "save": self.save
-        }
 
-        for img_name in sorted(os.listdir(self.img_dir)):
-            if not img_name.lower().endswith((".png", ".jpg", ".jpeg")):
-                continue
-
-            img_path = os.path.join(self.img_dir, img_name)
+        # os.scandir: DirEntry의 파일 타입 캐시를 사용하므로 추가 stat 없음
+        with os.scandir(self.img_dir) as it:
+            img_paths = [
+                e.path for e in it
+                if e.name.lower().endswith(_EXTS) and e.is_file()
+            ]
+        img_paths.sort()
 
-            results = self.model.predict(
-                source=img_path,
-                device=0 if torch.cuda.is_available() else "cpu",
-                **infer_kwargs
-            )
-
-            parsed = []
-            r = results[0]
+        for img_path, r in self._predict_batches(img_paths):
+            img_name = os.path.basename(img_path)
 
             # 파일명이 숫자라고 가정 (대회 포맷)
             image_id = int(os.path.splitext(img_name)[0])
 
-            for box in r.boxes:
-                cls_id = int(box.cls[0])
-                cid = self.mapper.yolo_to_category_fn(cls_id)
+            boxes = r.boxes
+            if len(boxes) == 0:
+                outputs[img_name] = []
+                continue
+
+            # box 단위 접근 대신 텐서 전체를 한 번에 CPU로 옮겨 numpy로 일괄 변환
+            xyxy = boxes.xyxy.cpu().numpy()
+            scores = boxes.conf.cpu().numpy()
+            cls_ids = boxes.cls.cpu().numpy().astype(np.int32)
 
-                x1, y1, x2, y2 = box.xyxy[0]
+            # xyxy → xywh
+            bboxes = np.concatenate([xyxy[:, :2], xyxy[:, 2:] - xyxy[:, :2]], axis=1)
+            cids = self.mapper.yolo_to_category_array(cls_ids)
 
-                parsed.append({
+            outputs[img_name] = [
+                {
                     "image_id": image_id,
                     "category_id": cid,
-                    "bbox": [
-                        float(x1),
-                        float(y1),
-                        float(x2 - x1),
-                        float(y2 - y1)
-                    ],
-                    "score": float(box.conf[0])
-                })
-
-            outputs[img_name] = parsed
+                    "bbox": bbox,
+                    "score": score
+                }
+                for cid, bbox, score in zip(cids.tolist(), bboxes.tolist(), scores.tolist())
+            ]
 
         print(f"[Predictor] total images: {len(outputs)}")
         
-        return outputs
\ No newline at end of file
+        return outputs
+
+    def _predict_batches(self, img_paths: list):
+        """
+        이미지 경로 목록을 batch 단위로 추론하여 (경로, 결과) 쌍을 순서대로 반환합니다.
+
+        Ultralytics의 파일 경로 입력은 메인 스레드에서 이미지를 하나씩 디코딩하므로,
+        현재 batch를 추론하는 동안 다음 batch를 스레드 풀(cv2.imdecode는 GIL 해제)에서
+        미리 디코딩하여 디코딩과 GPU 추론을 겹칩니다.
+
+        save=True이면 결과 이미지가 원본 파일명으로 저장되도록 미리 디코딩하지 않고
+        경로 목록 전체를 한 번의 스트리밍 predict 호출로 넘깁니다.
+        (numpy 입력은 "image{i}.jpg"로 저장되어 batch마다 서로 덮어씀)
+
+        Args:
+            img_paths (list): 정렬된 이미지 파일 경로 목록
+
+        Yields:
+            tuple: (이미지 경로, Ultralytics Results)
+        """
+        predict_kwargs = {
+            "batch": self.batch,
+            "device": self.device,
+            "conf": self.conf,
+            "iou": self.iou,
+            "max_det": self.max_det,
+            "save": self.save,
+            "verbose": False,
+        }
+
+        if self.save:
+            results = self.model.predict(source=img_paths, stream=True, **predict_kwargs)
+            yield from zip(img_paths, results)
+            return
+
+        chunks = [img_paths[i:i + self.batch] for i in range(0, len(img_paths), self.batch)]
+        if not chunks:
+            return
+
+        with ThreadPoolExecutor(max_workers=self.workers) as ex:
+            pending = [ex.submit(_imread, p) for p in chunks[0]]
+
+            for i, chunk in enumerate(chunks):
+                images = [f.result() for f in pending]
+
+                # 현재 batch 추론 전에 다음 batch 디코딩을 먼저 제출
+                if i + 1 < len(chunks):
+                    pending = [ex.submit(_imread, p) for p in chunks[i + 1]]
+
+                results = self.model.predict(source=images, **predict_kwargs)
+
+                # numpy 입력은 결과에 파일 경로가 남지 않으므로 입력 순서로 매칭
+                yield from zip(chunk, results)
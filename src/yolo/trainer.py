@@ -14,7 +14,12 @@ class Trainer:
 
     핵심 특징:
         - config(dict) 기반 학습 설정 관리
-        - GPU 사용 가능 시 자동으로 CUDA 사용
+        - GPU 사용 가능 시 자동으로 CUDA 사용 (train_args.device로 GPU 목록 지정 시 multi-GPU 학습)
+        - 학습 속도 관련 옵션 기본 적용 (config로 변경 가능)
+            - amp: mixed precision 학습 (기본 True)
+            - cache: 디코딩된 이미지를 RAM에 캐싱하여 data loader 병목 완화 (기본 "ram")
+            - workers: data loader 워커 수 (기본 min(8, CPU 코어 수))
+            - rect: rectangular batch 학습 (기본 False)
         - YOLO 학습 결과를 project/name 구조로 저장
 
     사용 목적:
@@ -41,6 +46,11 @@ class Trainer:
                 - train_args.project
                 - train_args.name
                 - train_args.val (optional)
+                - train_args.device (optional, 예: 0 / [0, 1] / "cpu")
+                - train_args.amp (optional)
+                - train_args.cache (optional)
+                - train_args.workers (optional)
+                - train_args.rect (optional)
                 - paths.base_dir
                 - paths.yolo.data_yaml
 
@@ -57,8 +67,8 @@ class Trainer:
         # model
         self.model = YOLO(train_cfg["model"])
 
-        # device
-        self.device = "cuda" if torch.cuda.is_available() else "cpu"
+        # device (config에 지정되지 않으면 GPU/CPU 자동 선택, [0, 1]처럼 목록 지정 시 multi-GPU)
+        self.device = train_cfg.get("device", "cuda" if torch.cuda.is_available() else "cpu")
         print(f"[Trainer] Using device: {self.device}")
 
         # data.yaml 경로
@@ -75,6 +85,12 @@ class Trainer:
         self.name = train_cfg["name"]
         self.val = train_cfg.get("val", False)
 
+        # 학습 속도 관련 옵션
+        self.amp = train_cfg.get("amp", True)
+        self.cache = train_cfg.get("cache", "ram")
+        self.workers = train_cfg.get("workers", min(8, os.cpu_count() or 1))
+        self.rect = train_cfg.get("rect", False)
+
     def train(self):
         """
         YOLO 모델 학습을 수행합니다.
@@ -88,6 +104,7 @@ class Trainer:
             - epoch, batch size, image size 설정
             - 학습 디바이스(CPU / GPU) 설정
             - validation 수행 여부 설정
+            - AMP / 이미지 캐싱 / data loader 워커 수 / rect 학습 설정
             - 학습 결과를 지정된 project/name 경로에 저장
 
         학습 결과:
@@ -112,6 +129,10 @@ class Trainer:
             "project": self.project,
             "name": self.name,
             "val": self.val,
+            "amp": self.amp,
+            "cache": self.cache,
+            "workers": self.workers,
+            "rect": self.rect,
         }
 
         self.model.train(**train_kwargs)
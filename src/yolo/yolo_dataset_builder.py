@@ -1,8 +1,70 @@
 # yolo_dataset_builder.py
 import os
-import json
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
+
+import numpy as np
 import yaml
 
+from src.utils.json_io import load_json
+
+# symlink 대상 이미지 확장자
+_EXTS = (".png", ".jpg", ".jpeg")
+
+
+def _safe_symlink(src: str, dst: str):
+    """symlink를 생성하며, 이미 존재하는 경우 생성을 생략합니다."""
+    try:
+        os.symlink(src, dst)
+    except FileExistsError:
+        pass
+
+
+def _convert_one(path: str, yolo_label_dir: str, cat_to_yolo: dict):
+    """
+    COCO JSON 파일 하나를 YOLO txt 라벨 파일로 변환합니다.
+
+    YOLODatasetBuilder.build_labels에서 프로세스 단위로 병렬 호출되는 작업 단위이며,
+    매퍼 객체 대신 {category_id: yolo_id} dict만 전달받습니다.
+
+    Args:
+        path (str): COCO annotation JSON 파일 경로
+        yolo_label_dir (str): YOLO txt 라벨을 저장할 디렉토리
+        cat_to_yolo (dict): {category_id: yolo_id} 매핑
+
+    Returns:
+        None
+    """
+    data = load_json(path)
+
+    image = data["images"][0]
+    img_w, img_h = image["width"], image["height"]
+    img_stem = os.path.splitext(image["file_name"])[0]
+
+    out_txt_path = os.path.join(yolo_label_dir, f"{img_stem}.txt")
+
+    anns = data["annotations"]
+
+    # annotation별 Python 연산 대신 파일 단위로 bbox 배열을 만들어 한 번에 정규화
+    # (float64 유지: 기존 Python float 연산과 동일한 결과)
+    bboxes = np.asarray([ann["bbox"] for ann in anns], dtype=np.float64).reshape(-1, 4)
+    cats = np.fromiter(
+        (cat_to_yolo[ann["category_id"]] for ann in anns), dtype=np.int64, count=len(anns)
+    )
+
+    x, y, w, h = bboxes.T
+    out_arr = np.column_stack([
+        cats,
+        (x + w * 0.5) / img_w,
+        (y + h * 0.5) / img_h,
+        w / img_w,
+        h / img_h,
+    ])
+
+    # annotation이 없으면 빈 파일 생성
+    np.savetxt(out_txt_path, out_arr, fmt="%d %.6f %.6f %.6f %.6f")
+
+
 class YOLODatasetBuilder:
     """
     COCO 형식 데이터셋을 YOLO 학습용 데이터셋 구조로 변환하는 클래스입니다.
@@ -44,6 +106,7 @@ class YOLODatasetBuilder:
         초기화 시 수행 작업:
             - COCO images / labels 디렉토리 경로 설정
             - YOLO images/train / labels/train 디렉토리 경로 설정
+            - category_id → yolo_id LUT 생성
             - 출력 디렉토리 자동 생성
         """
         self.cfg = config
@@ -63,6 +126,11 @@ class YOLODatasetBuilder:
         self.yolo_img_train_dir = os.path.join(self.yolo_dir, yolo["images"], "train")
         self.yolo_label_train_dir = os.path.join(self.yolo_dir, yolo["labels"], "train")
         
+        # category_id → yolo_id LUT (annotation마다 매퍼 메서드를 호출하지 않도록 한 번만 생성)
+        self._cat2yolo = {
+            cid: mapper.category_to_yolo_fn(cid) for cid in mapper.category_to_yolo
+        }
+
         # 디렉토리 생성
         os.makedirs(self.yolo_img_train_dir, exist_ok=True)
         os.makedirs(self.yolo_label_train_dir, exist_ok=True)
@@ -73,7 +141,7 @@ class YOLODatasetBuilder:
         COCO-style annotation JSON 파일을 YOLO 학습용 txt 라벨로 변환합니다.
 
         수행 내용:
-            - COCO label 디렉토리 내의 모든 JSON 파일 순회
+            - COCO label 디렉토리 내의 모든 JSON 파일을 프로세스 병렬로 변환
             - annotation의 bbox (x, y, w, h)를 YOLO 형식으로 정규화
             - CategoryMapper를 사용하여 category_id를 YOLO class_id로 변환
             - 이미지별 하나의 YOLO txt 파일 생성
@@ -88,31 +156,22 @@ class YOLODatasetBuilder:
         Returns:
             None
         """    
-        for filename in os.listdir(self.coco_label_dir):
-            if not filename.endswith(".json"):
-                continue
-
-            path = os.path.join(self.coco_label_dir, filename)
-            with open(path, encoding="utf-8") as f:
-                data = json.load(f)
-
-            image = data["images"][0]
-            img_w, img_h = image["width"], image["height"]
-            img_stem = os.path.splitext(image["file_name"])[0]
-            
-            out_txt_path = os.path.join(self.yolo_label_train_dir, f"{img_stem}.txt")
-
-            with open(out_txt_path, "w") as out:
-                for ann in data["annotations"]:
-                    x, y, w, h = ann["bbox"]
-                    
-                    xc = (x + w / 2) / img_w
-                    yc = (y + h / 2) / img_h
-                    nw = w / img_w
-                    nh = h / img_h
-
-                    yolo_id = self.mapper.category_to_yolo_fn(ann["category_id"])
-                    out.write(f"{yolo_id} {xc:.6f} {yc:.6f} {nw:.6f} {nh:.6f}\n")
+        paths = [
+            os.path.join(self.coco_label_dir, filename)
+            for filename in os.listdir(self.coco_label_dir)
+            if filename.endswith(".json")
+        ]
+
+        # 파일별 변환은 서로 독립적인 CPU 작업이므로 프로세스로 병렬 처리
+        # (프로세스로 넘길 수 있도록 매퍼 대신 LUT dict만 전달)
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+            list(ex.map(
+                _convert_one,
+                paths,
+                repeat(self.yolo_label_train_dir),
+                repeat(self._cat2yolo),
+                chunksize=64,
+            ))
 
         print("[YOLO Dataset Builder] YOLO txt 생성 완료")
     
@@ -136,20 +195,14 @@ class YOLODatasetBuilder:
         Returns:
             None
         """
-        for img_name in os.listdir(self.coco_img_dir):
-            if not img_name.lower().endswith((".png", ".jpg", ".jpeg")):
-                continue
-            
-            src = os.path.join(self.coco_img_dir, img_name)
-            dst = os.path.join(self.yolo_img_train_dir, img_name)
-
-            if os.path.exists(dst):
-                continue
-
-            try: 
-                os.symlink(src, dst) 
-            except FileExistsError: 
-                pass
+        with os.scandir(self.coco_img_dir) as it:
+            srcs = [e.path for e in it if e.name.lower().endswith(_EXTS)]
+        dsts = [os.path.join(self.yolo_img_train_dir, os.path.basename(src)) for src in srcs]
+
+        # symlink syscall은 GIL을 놓으므로 스레드로 병렬 생성
+        # (이미 존재하면 FileExistsError로 건너뜀, 별도 exists stat 생략)
+        with ThreadPoolExecutor(max_workers=32) as ex:
+            list(ex.map(_safe_symlink, srcs, dsts))
 
         print("[YOLODatasetBuilder] 이미지 symlink 생성 완료")
     
@@ -1,15 +1,26 @@
 from fastapi import FastAPI, UploadFile, File, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from ultralytics import YOLO
-from PIL import Image
-import logging
+import numpy as np
+import torch
+import cv2
+import asyncio
 import json
-import io
+import logging
 import os
 import uvicorn
 
+try:
+    import orjson
+except ImportError:  # orjson 미설치 환경에서는 표준 json 모듈 / JSONResponse 사용
+    orjson = None
+
+# 응답 직렬화 클래스 (orjson 설치 시 ORJSONResponse)
+ResponseClass = ORJSONResponse if orjson is not None else JSONResponse
+
 # FastAPI 앱 초기화
 app = FastAPI(
+    default_response_class=ResponseClass,
     title="Medicine Object Detection API",
     description="YOLO 모델을 사용하여 의약품 객체를 탐지하는 API입니다.",
     version="1.0.0"
@@ -35,16 +46,234 @@ if not logger.handlers:
 # 프로젝트 루트: /Users/apple/Downloads/_Part_2/Project
 MODEL_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src", "models", "best.pt")
 
+# 모델 입력 크기 (TensorRT 엔진 export 및 warmup에 사용)
+IMG_SIZE = 640
+
+# 요청 micro-batching 설정: 최대 MAX_BATCH개 요청을 MAX_WAIT_MS 동안 모아 한 번에 추론
+MAX_BATCH = int(os.getenv("MAX_BATCH", "8"))
+MAX_WAIT_MS = float(os.getenv("MAX_WAIT_MS", "5"))
+
+# 요청이 없는 구간이 WARMUP_INTERVAL_S 이상 지속되면 더미 추론으로 GPU를 깨워 둠 (GPU 사용 시)
+WARMUP_INTERVAL_S = float(os.getenv("WARMUP_INTERVAL_S", "5"))
+
 # 모델 전역 변수
 model = None
 
+# (image, future) 요청 큐와 이를 처리하는 배치 워커 태스크
+request_queue = None
+batch_task = None
+
+# GPU 추론용 pinned memory 입력 버퍼와 전용 CUDA stream (CUDA 사용 시에만 생성)
+staging = None
+cuda_stream = None
+
+# idle warmup 태스크와 마지막 실제 요청 시각 (event loop 시간 기준)
+warmup_task = None
+last_request_time = 0.0
+
+
+def resolve_model_path(pt_path: str) -> str:
+    """
+    CUDA 사용 가능 시 .pt 모델을 TensorRT FP16 엔진으로 변환한 경로를 반환합니다.
+
+    엔진은 최대 batch 크기가 MAX_BATCH로 고정되므로 파일명에 batch 크기를 포함합니다.
+    (예: best_b8.engine) 같은 폴더에 같은 MAX_BATCH로 만든 .pt보다 최신인 엔진이 있으면
+    재사용하고, 없거나 .pt가 더 최신이면(재학습 등) 다시 export합니다.
+    CUDA가 없거나 export에 실패하면 원래 .pt 경로를 그대로 사용합니다.
+    """
+    if not pt_path.endswith(".pt") or not torch.cuda.is_available():
+        return pt_path
+
+    engine_path = f"{os.path.splitext(pt_path)[0]}_b{MAX_BATCH}.engine"
+    if os.path.exists(engine_path) and os.path.getmtime(engine_path) >= os.path.getmtime(pt_path):
+        return engine_path
+
+    try:
+        print(f"Exporting TensorRT engine from {pt_path}")
+        exported = YOLO(pt_path).export(
+            format="engine", half=True, simplify=True, imgsz=IMG_SIZE, dynamic=True, batch=MAX_BATCH
+        )
+        # Ultralytics는 <stem>.engine으로 저장하므로 batch 크기를 포함한 이름으로 변경
+        os.replace(exported, engine_path)
+        return engine_path
+    except Exception:
+        logger.exception("TensorRT export failed, falling back to %s", pt_path)
+        return pt_path
+
+
+def letterbox(image: np.ndarray, size: int = IMG_SIZE):
+    """
+    비율을 유지한 채 size x size 크기로 resize 후 남는 영역을 padding(letterbox)합니다.
+
+    Ultralytics 내부 전처리 대신 OpenCV(cv2.resize / copyMakeBorder)로 미리 맞춰 두며,
+    박스 좌표를 원본 기준으로 되돌리기 위한 scale / padding 값을 함께 반환합니다.
+
+    Returns:
+        tuple: (letterbox 이미지, scale, pad_x, pad_y)
+    """
+    h, w = image.shape[:2]
+    scale = min(size / h, size / w)
+    new_w, new_h = round(w * scale), round(h * scale)
+
+    if (new_w, new_h) != (w, h):
+        image = cv2.resize(image, (new_w, new_h), interpolation=cv2.INTER_LINEAR)
+
+    pad_x = (size - new_w) // 2
+    pad_y = (size - new_h) // 2
+    image = cv2.copyMakeBorder(
+        image,
+        pad_y, size - new_h - pad_y,
+        pad_x, size - new_w - pad_x,
+        cv2.BORDER_CONSTANT,
+        value=(114, 114, 114),
+    )
+    return image, scale, pad_x, pad_y
+
+
+def preprocess(contents: bytes):
+    """
+    업로드된 이미지 bytes를 디코딩하고 모델 입력 크기로 letterbox합니다.
+
+    이벤트 루프를 막지 않도록 asyncio.to_thread로 호출되며,
+    박스 좌표 복원을 위해 scale / padding 및 원본 크기를 함께 반환합니다.
+
+    Returns:
+        tuple: (letterbox 이미지, scale, pad_x, pad_y, 원본 width, 원본 height)
+    """
+    # PIL 대신 OpenCV로 바로 numpy(BGR) 디코딩 (Ultralytics는 numpy 입력을 BGR로 처리)
+    image = cv2.imdecode(np.frombuffer(contents, dtype=np.uint8), cv2.IMREAD_COLOR)
+    if image is None:
+        raise ValueError("이미지를 디코딩할 수 없습니다.")
+
+    orig_h, orig_w = image.shape[:2]
+    image, scale, pad_x, pad_y = letterbox(image)
+    return image, scale, pad_x, pad_y, orig_w, orig_h
+
+
+def unletterbox_box(box, scale, pad_x, pad_y, width, height):
+    """letterbox 이미지 기준 xyxy 좌표를 원본 이미지 기준으로 되돌립니다. (원본 범위로 clip)"""
+    x1, y1, x2, y2 = box
+    return [
+        min(max((x1 - pad_x) / scale, 0.0), width),
+        min(max((y1 - pad_y) / scale, 0.0), height),
+        min(max((x2 - pad_x) / scale, 0.0), width),
+        min(max((y2 - pad_y) / scale, 0.0), height),
+    ]
+
+
+def run_inference(images):
+    """
+    letterbox된 BGR 이미지 목록을 한 번의 model 호출로 추론합니다.
+
+    CUDA 사용 시 이미지를 pinned memory 버퍼에 모은 뒤 전용 CUDA stream에서
+    non_blocking으로 GPU에 올리고, RGB float(0~1) BCHW 텐서로 변환하여 model에 넘깁니다.
+    CPU 환경에서는 numpy 이미지 목록을 그대로 넘깁니다.
+
+    Args:
+        images (list[np.ndarray]): IMG_SIZE x IMG_SIZE BGR 이미지 목록 (최대 MAX_BATCH개)
+
+    Returns:
+        list: Ultralytics Results 목록 (images와 같은 순서)
+    """
+    if cuda_stream is None:
+        return model(images, imgsz=IMG_SIZE, verbose=False)
+
+    buf = staging[:len(images)]
+    for i, image in enumerate(images):
+        buf[i].copy_(torch.from_numpy(image))
+
+    with torch.cuda.stream(cuda_stream):
+        batch = buf.to("cuda", non_blocking=True)
+        # BGR HWC uint8 → RGB CHW float(0~1)
+        batch = batch.flip(-1).permute(0, 3, 1, 2).float().div_(255)
+        # TensorRT 엔진은 이 stream을 기다리지 않고 입력을 읽으므로 전송/전처리 완료를 먼저 보장
+        cuda_stream.synchronize()
+        results = model(batch, imgsz=IMG_SIZE, verbose=False)
+
+    # 추론/후처리(NMS, scale_boxes 등) 커널이 모두 끝난 뒤 결과를 반환
+    # (이벤트 루프 스레드는 default stream에서 결과를 읽고, 다음 배치는 이 호출이 끝난 뒤에만 staging 버퍼를 덮어씀)
+    cuda_stream.synchronize()
+    return results
+
+
+async def batch_worker():
+    """
+    요청 큐에서 이미지를 모아 한 번의 model 호출로 추론하고, 결과를 각 요청의 future에 돌려줍니다.
+
+    첫 요청이 도착한 뒤 최대 MAX_WAIT_MS 동안, 또는 MAX_BATCH개가 찰 때까지 요청을 모읍니다.
+    추론은 별도 스레드에서 실행하여 그동안 이벤트 루프가 다음 요청을 받을 수 있게 합니다.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        items = [await request_queue.get()]
+        deadline = loop.time() + MAX_WAIT_MS / 1000
+        while len(items) < MAX_BATCH:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                items.append(await asyncio.wait_for(request_queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        images = [image for image, _ in items]
+        try:
+            results = await asyncio.to_thread(run_inference, images)
+        except Exception as e:
+            for _, fut in items:
+                if not fut.done():
+                    fut.set_exception(e)
+            continue
+
+        for (_, fut), result in zip(items, results):
+            if not fut.done():
+                fut.set_result(result)
+
+
+async def idle_warmup():
+    """
+    요청이 WARMUP_INTERVAL_S 이상 없으면 더미 이미지 추론을 수행합니다.
+
+    추론 호출 간격이 벌어지면 GPU clock이 내려가 다음 요청의 지연이 커지므로,
+    idle 구간에도 주기적으로 추론을 돌려 둡니다. 더미 요청도 요청 큐를 거치므로
+    실제 요청과 staging 버퍼를 동시에 사용하지 않습니다.
+    """
+    loop = asyncio.get_running_loop()
+    dummy = np.zeros((IMG_SIZE, IMG_SIZE, 3), dtype=np.uint8)
+    while True:
+        await asyncio.sleep(WARMUP_INTERVAL_S)
+        if loop.time() - last_request_time < WARMUP_INTERVAL_S or not request_queue.empty():
+            continue
+
+        fut = loop.create_future()
+        await request_queue.put((dummy, fut))
+        try:
+            await fut
+        except Exception:
+            logger.exception("Idle warmup inference failed")
+
+
 @app.on_event("startup")
 async def startup_event():
-    """앱 시작 시 모델을 로드합니다."""
-    global model
+    """앱 시작 시 모델을 로드하고 warmup 추론 후 배치 워커(및 GPU 사용 시 idle warmup)를 시작합니다."""
+    global model, request_queue, batch_task, staging, cuda_stream, warmup_task
     if os.path.exists(MODEL_PATH):
-        print(f"Loading model from {MODEL_PATH}")
-        model = YOLO(MODEL_PATH)
+        model_path = resolve_model_path(MODEL_PATH)
+        print(f"Loading model from {model_path}")
+        model = YOLO(model_path)
+
+        if torch.cuda.is_available():
+            # 요청마다 할당하지 않도록 최대 배치 크기의 pinned 버퍼와 CUDA stream을 한 번만 생성
+            staging = torch.empty((MAX_BATCH, IMG_SIZE, IMG_SIZE, 3), dtype=torch.uint8, pin_memory=True)
+            cuda_stream = torch.cuda.Stream()
+
+        # 첫 요청이 엔진 초기화 비용을 떠안지 않도록 더미 이미지로 warmup
+        run_inference([np.zeros((IMG_SIZE, IMG_SIZE, 3), dtype=np.uint8)])
+
+        request_queue = asyncio.Queue()
+        batch_task = asyncio.create_task(batch_worker())
+        if cuda_stream is not None:
+            warmup_task = asyncio.create_task(idle_warmup())
     else:
         print(f"Model not found at {MODEL_PATH}")
         raise FileNotFoundError(f"Model file not found: {MODEL_PATH}")
@@ -58,7 +287,7 @@ async def predict_image(file: UploadFile = File(...)):
     """
     이미지 파일을 업로드받아 객체 탐지를 수행합니다.
     """
-    global model
+    global model, last_request_time
     if model is None:
         raise HTTPException(status_code=500, detail="Model not loaded")
     
@@ -69,18 +298,26 @@ async def predict_image(file: UploadFile = File(...)):
     try:
         # 이미지 읽기
         contents = await file.read()
-        image = Image.open(io.BytesIO(contents)).convert("RGB")
+        # 디코딩 + 모델 입력 크기로 letterbox (박스 좌표 복원용 scale/padding 보관)
+        # 동시 요청의 전처리가 이벤트 루프에서 직렬화되지 않도록 별도 스레드에서 실행
+        image, scale, pad_x, pad_y, orig_w, orig_h = await asyncio.to_thread(preprocess, contents)
         
-        # 추론 수행
-        results = model(image)
+        # 추론 수행 (배치 워커에 요청을 넣고 결과를 기다림)
+        loop = asyncio.get_running_loop()
+        last_request_time = loop.time()
+        fut = loop.create_future()
+        await request_queue.put((image, fut))
+        results = [await fut]
         
         # 결과 처리
         predictions = []
         for result in results:
             # Boxes 객체 추출
             for box in result.boxes:
-                # 좌표, 신뢰도, 클래스 추출
-                x1, y1, x2, y2 = box.xyxy[0].tolist()
+                # 좌표(원본 이미지 기준으로 복원), 신뢰도, 클래스 추출
+                x1, y1, x2, y2 = unletterbox_box(
+                    box.xyxy[0].tolist(), scale, pad_x, pad_y, orig_w, orig_h
+                )
                 confidence = float(box.conf[0])
                 cls_id = int(box.cls[0])
                 class_name = model.names[cls_id]
@@ -130,16 +367,31 @@ async def predict_image(file: UploadFile = File(...)):
         # Log inference result (filename + payload)
         try:
             payload = {"pills": pills}
-            logger.info(f"Inference - file=%s result=%s", file.filename, json.dumps(payload, ensure_ascii=False))
+            if orjson is not None:
+                payload_str = orjson.dumps(payload).decode()
+            else:
+                payload_str = json.dumps(payload, ensure_ascii=False)
+            logger.info(f"Inference - file=%s result=%s", file.filename, payload_str)
         except Exception:
             logger.exception("Failed to log inference payload")
 
-        return JSONResponse(content={"pills": pills})
+        return ResponseClass(content={"pills": pills})
 
     except Exception as e:
         logger.exception("Inference error for file: %s", getattr(file, "filename", "<unknown>"))
         raise HTTPException(status_code=500, detail=str(e))
 
 if __name__ == "__main__":
-    # 포트 8000번에서 실행
-    uvicorn.run("server:app", host="0.0.0.0", port=8000, reload=True)
+    # 워커 프로세스마다 startup_event가 실행되므로, 여러 워커가 같은 .engine 경로로
+    # 동시에 export하지 않도록 워커를 띄우기 전에 한 번만 export (워커는 생성된 엔진을 재사용)
+    if os.path.exists(MODEL_PATH):
+        resolve_model_path(MODEL_PATH)
+
+    # 포트 8000번에서 실행 (운영용: reload 비활성화, WORKERS 환경변수로 프로세스 수 지정)
+    # loop / http는 기본값(auto): uvloop / httptools가 설치되어 있으면 자동으로 사용
+    uvicorn.run(
+        "server:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=int(os.getenv("WORKERS", "1")),
+    )